@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 
 import pygame
-import random
+import numpy as np
 import click
 import copy
 import math
-import time
 import sys
 import os
+
+try:
+    from numba import njit
+except ImportError:
+    # physics runs as plain python without numba installed
+    def njit(*args, **kwargs):
+        return lambda func: func
  
 
 ICON = 'lander_icon.gif'
@@ -18,6 +24,12 @@ WINDOW_CAPTION = 'Lunar Lander, (c) 1973'
 XDIM = 1024
 YDIM = 768
 WINDOW_SIZE = (XDIM, YDIM)
+# window uncovered or restored, its contents need pushing again
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+HANDLED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.QUIT) + EXPOSE_EVENTS
+FPS = 30
+# physics constants are tuned per tick at the original 30 fps
+PHYS_DT_MS = 1000 // 30
 WHITE = (255, 255, 255)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
@@ -25,6 +37,15 @@ BLACK = (0, 0, 0)
 RED = (255, 0, 0)
 GRAVITY = 0.05
 FUEL = 100
+BOUNCE = 0.7
+SPIN_DAMP = 0.5
+# terrain height varies up to this many pixels either side of its midline
+TERRAIN_BAND = 60
+
+# thrust direction multipliers for each whole degree of ship rotation;
+# pygame's 0 degrees points up, so shift by 90 before projecting onto x and y
+_COS = tuple(math.cos(math.radians((d + 90) % 360)) for d in range(360))
+_SIN = tuple(-math.sin(math.radians((d + 90) % 360)) for d in range(360))
 
 # TODO:
 #   - detect collisions with terrain
@@ -38,6 +59,64 @@ FUEL = 100
 #       - handle signals to kill full screen
 
 
+# ship state is float64 apart from the whole-degree heading and spin rate;
+# pinning the types lets numba compile a single specialization instead of
+# one per int/float mix of arguments
+@njit('Tuple((float64, float64, float64, float64, int64, int64, float64, float64))'
+      '(float64, float64, float64, float64, float64, int64, int64,'
+      ' float64, float64, float64, float64, float64)', cache=True)
+def step(shipx, shipy, xspeed, yspeed, thrust, degree, degree_change, fuel,
+         thrust_fuel_burn, spin_fuel_burn, xdim, ydim):
+    ''' advance ship physics by one tick
+        - rotation, thrust, gravity and screen edge bounces
+        - absolute speed
+        - fuel consumption
+
+        returns (shipx, shipy, xspeed, yspeed, degree, degree_change,
+                 speed, fuel)
+    '''
+    # pygame degree positions:
+    #    0 = up
+    #   90 = left
+    #  180 = down
+    #  270 = right
+    degree = (degree + degree_change) % 360
+
+    # thrust level in x and y directions based on engine thrust and
+    # degrees ship is pointed
+    x_thrust_multiplier = _COS[degree]
+    y_thrust_multiplier = _SIN[degree]
+
+    # increase speed based on thrust level
+    xspeed += thrust * x_thrust_multiplier
+    yspeed += thrust * y_thrust_multiplier
+
+    # gravity always increases speed in y dimention
+    yspeed += GRAVITY
+
+    # bounce back with diminished speed if ship passes a screen edge
+    if (shipy > ydim and yspeed > 0) or (shipy < 0 and yspeed < 0):
+        yspeed *= -BOUNCE
+        xspeed *= BOUNCE
+        degree_change = int(degree_change * SPIN_DAMP)
+    if (shipx > xdim and xspeed > 0) or (shipx < 0 and xspeed < 0):
+        xspeed *= -BOUNCE
+        yspeed *= BOUNCE
+        degree_change = int(degree_change * SPIN_DAMP)
+
+    # calculate absoluted speed vector (for speed indicator)
+    speed = math.hypot(xspeed, yspeed)
+
+    # ship x,y coordinates
+    shipx += xspeed
+    shipy += yspeed
+
+    # update fuel reserves
+    fuel = max(0.0, fuel - thrust_fuel_burn - spin_fuel_burn)
+
+    return (shipx, shipy, xspeed, yspeed, degree, degree_change, speed, fuel)
+
+
 class Terrain(object):
 
     def __init__(self, where, xdim, ydim, landing_zones=2):
@@ -48,6 +127,7 @@ class Terrain(object):
         #     across surface
         self.type = where
         self.terrain = None
+        self._terrain_tuple = None
         self.landing_zones = landing_zones
         self.xdim = xdim
         self.ydim = ydim
@@ -57,41 +137,39 @@ class Terrain(object):
         '''
         if self.terrain is None:
             self._gen_terrain()
-        return self.terrain
+        return self._terrain_tuple
 
     def _gen_terrain(self):
         ''' randomly generate terrain
             - always provide at least 2 landable (horizontally level) surfaces
         '''
-        terrain_points = []
-        tx = 0
-        ty = self.ydim * 0.85
-        lastx = 100
-        lasty = ty
-        flat_segments = [random.randint(10, self.xdim), random.randint(10, self.xdim)]
-        flat_segments.sort()
-        next_flat_segment = flat_segments.pop(0)
-        while True:
-            if ty < self.ydim:
-                ty += 100
-            if ty > self.ydim:
-                ty -= 100
-            terrain_points.append((tx, ty))
-            tx += random.randint(40,100)
-            ty += random.randint(-100,100)
-            if next_flat_segment < tx:
-                ty = lasty
-                try:
-                    next_flat_segment = flat_segments.pop(0)
-                except IndexError:
-                    next_flat_segment = sys.maxsize
-            if tx > self.xdim:
-                tx = self.xdim
-                terrain_points.append((tx, ty))
-                break
-            lasty = ty
-
+        # enough 40-100px steps to always reach the right edge of the screen
+        n = self.xdim // 40 + 8
+        tx = np.concatenate(([0], np.cumsum(np.random.randint(40, 101, size=n))))
+
+        # stop at the first point past the right edge, pinned to the edge
+        last = np.searchsorted(tx, self.xdim)
+        tx = tx[:last + 1]
+        tx[-1] = self.xdim
+
+        # random walk of up to 100px per step, with its drift removed and
+        # squeezed into a band along the bottom of the screen so it can't
+        # wander off either edge
+        walk = np.concatenate(([0], np.cumsum(np.random.randint(-100, 101, size=last))))
+        walk = walk - np.linspace(0, walk[-1], len(walk))
+        peak = np.abs(walk).max()
+        if peak > TERRAIN_BAND:
+            walk *= TERRAIN_BAND / peak
+        ty = np.clip(self.ydim - TERRAIN_BAND - 2 + walk, 0, self.ydim - 2)
+
+        # level off a couple of two-segment stretches to land on
+        zones = min(self.landing_zones, len(tx) - 2)
+        for idx in np.random.choice(len(tx) - 2, size=zones, replace=False):
+            ty[idx:idx + 3] = ty[idx]
+
+        terrain_points = list(map(tuple, np.stack([tx, ty], axis=1).astype(int).tolist()))
         self.terrain = terrain_points
+        self._terrain_tuple = tuple(terrain_points)
 
     def check_collision(self, shape):
         ''' determine if something is colliding with terrain
@@ -104,16 +182,44 @@ class Terrain(object):
         pass
 
 
-class Lander(object):
+class Lander:
+    __slots__ = (
+        'current_surface',
+        'shipx',
+        'shipy',
+        'xspeed',
+        'yspeed',
+        'thrust',
+        'thrust_level',
+        'degree',
+        'degree_change',
+        'fuel',
+        'thrust_fuel_burn',
+        'spin_fuel_burn',
+        'xdim',
+        'ydim',
+        'pause',
+        'speed',
+        '_ship_state',
+        '_ship_base',
+        '_rot_cache',
+        '_ship_template',
+        '_jet_surfaces',
+    )
+
     SHIP_SIZE = (41,120)
 
-    THRUST_MAP = {
-        0: 0,
-        1: GRAVITY * 0.9,
-        2: GRAVITY * 2.0,
-        3: GRAVITY * 5.0,
-        4: GRAVITY * 10.0,
-    }
+    # rotated ship surfaces kept, two full turns' worth
+    ROT_CACHE_SIZE = 720
+
+    # engine thrust, indexed by thrust_level
+    THRUST_LEVELS = (
+        0.0,
+        GRAVITY * 0.9,
+        GRAVITY * 2.0,
+        GRAVITY * 5.0,
+        GRAVITY * 10.0,
+    )
 
     SHIP_POINTS = [
         # top
@@ -173,11 +279,11 @@ class Lander(object):
     def __init__(self, xdim, ydim):
         ''' initialize variables controlling ship movement
         '''
-        self.current_surface = pygame.Surface(self.SHIP_SIZE)
         self.shipx = 250
         self.shipy = 150
         self.xspeed = 0
         self.yspeed = 0
+        self.speed = 0
         self.thrust = 0
         self.thrust_level = 0
         self.degree = 0
@@ -188,6 +294,25 @@ class Lander(object):
         self.xdim = xdim
         self.ydim = ydim
         self.pause = False
+        # most recently used rotated ship surfaces, keyed by
+        # (thrust_level, spin direction, fuel > 0, whole degrees)
+        self._rot_cache = {}
+        # last unrotated ship surface and the
+        # (thrust_level, spin direction, fuel > 0) it was built for
+        self._ship_state = None
+        self._ship_base = None
+        # ship outline and jets for every (thrust_level, spin direction),
+        # drawn once and composited whenever the ship state changes
+        self._ship_template = self._blank_surface()
+        pygame.draw.polygon(self._ship_template, WHITE, self.SHIP_POINTS, 1)
+        self._jet_surfaces = {}
+        for thrust_level in range(len(self.THRUST_LEVELS)):
+            for spin in (-1, 0, 1):
+                self._jet_surfaces[(thrust_level, spin)] = self._draw_jets(
+                    thrust_level, spin)
+
+        # frames can be drawn before the first physics tick runs
+        self.current_surface = self._get_rotated_surface()
 
     def get_position(self):
         ''' returns coordinates of ship
@@ -206,85 +331,27 @@ class Lander(object):
             - update ship surface with current location, rotation, and jets
             - fuel consumption
         '''
-        self.current_surface = self._get_ship_surface()
-        self.thrust = self.THRUST_MAP[self.thrust_level]
+        self.thrust = self.THRUST_LEVELS[self.thrust_level]
 
         if self.fuel <= 0:
             self.thrust = 0
 
-        # pygame degree positions:
-        #    0 = up
-        #   90 = left
-        #  180 = down
-        #  270 = right
-        self.degree += self.degree_change
-        if self.degree > 360:
-            self.degree -= 360
-        if self.degree < 0:
-            self.degree += 360
-    
-        # maths to calculate thurst level in x and y directions based on engine
-        # thrust and degrees ship is pointed
-        degree_adjust = self.degree
-        degree_adjust += 90
-        if degree_adjust >= 360:
-            degree_adjust -= 360
-        radians = float("{0:.3f}".format(math.radians(degree_adjust)))
-        x_thrust_multiplier = float("{0:.3f}".format(math.cos(radians)))
-        y_thrust_multiplier = float("{0:.3f}".format(math.sin(-radians)))
-
-        # increase speed based on thrust level
-        self.xspeed += self.thrust * x_thrust_multiplier
-        self.yspeed += self.thrust * y_thrust_multiplier
-
-        # gravity always increases speed in y dimention
-        self.yspeed += GRAVITY
-
-        # bounce back with diminished speed if ship passes a screen edge
-        if self.shipy > self.ydim and self.yspeed > 0:
-            self.yspeed = (self.yspeed * 0.7) * -1
-            self.xspeed *= 0.7
-            self.degree_change *= 0.5
-        if self.shipy < 0 and self.yspeed < 0:
-            self.yspeed = (self.yspeed * 0.7) * -1
-            self.xspeed *= 0.7
-            self.degree_change *= 0.5
-        if self.shipx > self.xdim and self.xspeed > 0:
-            self.xspeed = (self.xspeed * 0.7) * -1
-            self.yspeed *= 0.7
-            self.degree_change *= 0.5
-        if self.shipx < 0 and self.xspeed < 0:
-            self.xspeed = (self.xspeed * 0.7) * -1
-            self.yspeed *= 0.7
-            self.degree_change *= 0.5
-
-        # calculate absoluted speed vector (for speed indicator)
-        self.speed = math.sqrt(self.xspeed**2 + self.yspeed**2)
-
-        # ship x,y coordinates
-        self.shipx += self.xspeed
-        self.shipy += self.yspeed
-    
-        # update fuel reserves
-        self.fuel = self.fuel - self.thrust_fuel_burn - self.spin_fuel_burn
-        if self.fuel < 0:
-            self.fuel = 0
+        (self.shipx, self.shipy, self.xspeed, self.yspeed, self.degree,
+         self.degree_change, self.speed, self.fuel) = step(
+            self.shipx, self.shipy, self.xspeed, self.yspeed, self.thrust,
+            self.degree, self.degree_change, self.fuel, self.thrust_fuel_burn,
+            self.spin_fuel_burn, self.xdim, self.ydim)
 
-        self.current_surface =  pygame.transform.rotate(self.current_surface, self.degree)
+        self.current_surface = self._get_rotated_surface()
 
     def thrust_up(self):
-        self.thrust_fuel_burn += 0.05
-        self.thrust_level += 1
-        if self.thrust_level > 4:
-            self.thrust_level = 0
-            self.thrust_fuel_burn = 0
+        # wraps back around to engines off past max thrust
+        self.thrust_level = (self.thrust_level + 1) % len(self.THRUST_LEVELS)
+        self.thrust_fuel_burn = self.thrust_level * 0.05
 
     def thrust_down(self):
-        self.thrust_level -= 1
-        self.thrust_fuel_burn -= 0.05
-        if self.thrust_level < 0:
-            self.thrust_level = 0
-            self.thrust_fuel_burn = 0
+        self.thrust_level = max(0, self.thrust_level - 1)
+        self.thrust_fuel_burn = self.thrust_level * 0.05
 
     def spin_left(self):
         if self.fuel > 0:
@@ -301,46 +368,112 @@ class Lander(object):
             self.degree_change = 0
             self.spin_fuel_burn = 0
 
+    def refuel(self):
+        self.fuel += 10
+
+    def level(self):
+        self.degree = 0
+
+    def toggle_pause(self):
+        self.pause = not self.pause
+
+    def _get_rotated_surface(self):
+        ''' look up the ship surface for the current jets and heading,
+            building and rotating it only when that state isn't cached
+
+            returns rotated ship surface
+        '''
+        if self.fuel > 0:
+            spin = (self.degree_change > 0) - (self.degree_change < 0)
+            key = (self.thrust_level, spin, True, self.degree)
+        else:
+            # no jets are drawn without fuel, so every jet state looks the same
+            key = (0, 0, False, self.degree)
+        # re-insert on every hit so the dict stays ordered least recently used
+        # first, and evict from the front once full
+        surface = self._rot_cache.pop(key, None)
+        if surface is None:
+            surface = pygame.transform.rotate(self._get_ship_surface(), key[3])
+            surface = surface.convert()
+            if len(self._rot_cache) >= self.ROT_CACHE_SIZE:
+                del self._rot_cache[next(iter(self._rot_cache))]
+        self._rot_cache[key] = surface
+        return surface
+
     def _get_ship_surface(self):
-        ''' starts with blank jet surface, layeres on other jet surface according
-            to thrust level, overlay ship last so jets are underneath
-            
+        ''' starts with blank surface, layers on the prerendered jets for the
+            current thrust level and spin, overlay ship last so jets are
+            underneath
+
             returns finished ship surface
         '''
-        # build base ship surgace
-        base_surface = pygame.Surface(self.SHIP_SIZE)
-        base_surface.fill(BLACK)
-        base_surface.set_colorkey(BLACK)
-    
-        # ship shape
-        ship_surface = pygame.Surface(self.SHIP_SIZE)
-        ship_surface.fill(BLACK)
-        ship_surface.set_colorkey(BLACK)
-        pygame.draw.polygon(ship_surface, WHITE, self.SHIP_POINTS, 1)
- 
-        # variable jet size
-        jet_surface = pygame.Surface(self.SHIP_SIZE)
-        jet_surface.fill(BLACK)
-        jet_surface.set_colorkey(BLACK)
+        spin = (self.degree_change > 0) - (self.degree_change < 0)
+        state = (self.thrust_level, spin, self.fuel > 0)
+        if state == self._ship_state:
+            return self._ship_base
 
+        base_surface = self._blank_surface()
         if self.fuel > 0:
-            if self.thrust_level > 0:
-                pygame.draw.polygon(jet_surface, WHITE, self.SM_JET_POINTS, 1)
-            if self.thrust_level > 1:
-                pygame.draw.polygon(jet_surface, WHITE, self.MED_JET_POINTS, 1)
-            if self.thrust_level > 2:
-                pygame.draw.polygon(jet_surface, WHITE, self.BIG_JET_POINTS, 1)
-            if self.thrust_level > 3:
-                pygame.draw.polygon(jet_surface, WHITE, self.MAX_JET_POINTS, 1)
-            if self.degree_change < 0:
-                pygame.draw.polygon(jet_surface, WHITE, self.LEFT_JET_POINTS, 1)
-            if self.degree_change > 0:
-                pygame.draw.polygon(jet_surface, WHITE, self.RIGHT_JET_POINTS, 1)
-
-        jet_surface.blit(ship_surface, (0,0))
-        base_surface.blit(jet_surface, (0,0))
+            base_surface.blit(self._jet_surfaces[(self.thrust_level, spin)], (0,0))
+        base_surface.blit(self._ship_template, (0,0))
+
+        self._ship_state = state
+        self._ship_base = base_surface
         return base_surface
 
+    def _draw_jets(self, thrust_level, spin):
+        ''' draws jets sized by thrust level, plus a side jet when spinning
+
+            returns jet surface
+        '''
+        jet_surface = self._blank_surface()
+        if thrust_level > 0:
+            pygame.draw.polygon(jet_surface, WHITE, self.SM_JET_POINTS, 1)
+        if thrust_level > 1:
+            pygame.draw.polygon(jet_surface, WHITE, self.MED_JET_POINTS, 1)
+        if thrust_level > 2:
+            pygame.draw.polygon(jet_surface, WHITE, self.BIG_JET_POINTS, 1)
+        if thrust_level > 3:
+            pygame.draw.polygon(jet_surface, WHITE, self.MAX_JET_POINTS, 1)
+        if spin < 0:
+            pygame.draw.polygon(jet_surface, WHITE, self.LEFT_JET_POINTS, 1)
+        if spin > 0:
+            pygame.draw.polygon(jet_surface, WHITE, self.RIGHT_JET_POINTS, 1)
+        return jet_surface
+
+    def _blank_surface(self):
+        ''' returns empty ship sized surface, transparent where BLACK
+        '''
+        surface = pygame.Surface(self.SHIP_SIZE).convert()
+        surface.fill(BLACK)
+        surface.set_colorkey(BLACK)
+        return surface
+
+
+def quit_game(lander=None):
+    ''' close the game window and exit
+    '''
+    pygame.display.quit()
+    sys.exit(0)
+
+
+# key handlers, each called with the Lander being flown
+KEYDOWN_ACTIONS = {
+    pygame.K_UP: Lander.thrust_up,
+    pygame.K_DOWN: Lander.thrust_down,
+    pygame.K_LEFT: Lander.spin_left,
+    pygame.K_RIGHT: Lander.spin_right,
+    pygame.K_ESCAPE: quit_game,
+    pygame.K_r: Lander.refuel,
+    pygame.K_l: Lander.level,
+    pygame.K_p: Lander.toggle_pause,
+}
+
+KEYUP_ACTIONS = {
+    pygame.K_LEFT: Lander.spin_stop,
+    pygame.K_RIGHT: Lander.spin_stop,
+}
+
 
 @click.command()
 @click.option('--window', is_flag=True, help='Run In Window Mode')
@@ -351,6 +484,11 @@ def main(window, nobg):
     pygame.init()
     pygame.mouse.set_visible(False)
 
+    # only keyboard, quit and expose events are handled, have SDL drop the
+    # rest before they reach the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(HANDLED_EVENTS)
+
     if window is True:
         screen = pygame.display.set_mode(WINDOW_SIZE)
         xdim = XDIM
@@ -364,10 +502,15 @@ def main(window, nobg):
     icon = pygame.image.load(ICON_FILE)
     pygame.display.set_icon(icon)
 
-    BACKGROUND = 'lunar_surface.gif'
-    BACKGROUND_FILE = os.path.join(os.path.dirname(__file__), BACKGROUND)
-    bg = pygame.image.load(BACKGROUND_FILE)
-    bg = pygame.transform.scale(bg, (xdim, ydim))
+    if nobg is True:
+        bg = pygame.Surface((xdim, ydim)).convert()
+        bg.fill(BLACK)
+    else:
+        BACKGROUND = 'lunar_surface.gif'
+        BACKGROUND_FILE = os.path.join(os.path.dirname(__file__), BACKGROUND)
+        bg = pygame.image.load(BACKGROUND_FILE)
+        bg = pygame.transform.scale(bg, (xdim, ydim))
+        bg = bg.convert()
 
     pygame.display.set_caption(WINDOW_CAPTION)
     font = pygame.font.Font(FONT_FILE, 20)
@@ -375,69 +518,109 @@ def main(window, nobg):
     lander = Lander(xdim, ydim)
     terrain = Terrain("moon", xdim, ydim)
 
+    # neither background nor terrain change between frames, bake the moon
+    # terrain into the background once
+    pygame.draw.lines(bg, WHITE, False, terrain.get_terrain(), 2)
+
     clock = pygame.time.Clock()
 
+    last_msg = None
+    last_text = None
+    last_textpos = None
+
+    # only the ship and readout change between frames, so after drawing the
+    # whole screen once just repaint and push the rects they cover
+    screen_rect = screen.get_rect()
+    prev_ship_rect = None
+    full_update = True
+
+    # physics advances in fixed steps however long each frame takes,
+    # carrying leftover time over to the next frame
+    acc = 0
+    prev = pygame.time.get_ticks()
+
     while True:
         if lander.pause is True:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_p:
-                        lander.pause = False
-                        break
-            time.sleep(0.1)
-            continue
-
-        if nobg is True:
-            screen.fill(BLACK)
-        else:
-            screen.blit(bg, (0,0))
-     
-
-        # draw moon terrain
-        pygame.draw.lines(screen, WHITE, False, terrain.get_terrain(), 2)
+            # sleep in SDL until a key or quit event arrives
+            while lander.pause is True:
+                event = pygame.event.wait()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                    lander.pause = False
+                elif event.type == pygame.QUIT:
+                    quit_game(lander)
+                elif event.type in EXPOSE_EVENTS:
+                    # screen still holds the whole paused frame
+                    pygame.display.flip()
+            # time spent paused isn't physics to catch up on
+            prev = pygame.time.get_ticks()
 
         # handle inputs
-        for event in pygame.event.get():
+        for event in pygame.event.get(HANDLED_EVENTS):
+            if event.type in EXPOSE_EVENTS:
+                full_update = True
+                continue
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    lander.thrust_up()
-                if event.key == pygame.K_DOWN:
-                    lander.thrust_down()
-                if event.key == pygame.K_LEFT:
-                    lander.spin_left()
-                if event.key == pygame.K_RIGHT:
-                    lander.spin_right()
-                if event.key == pygame.K_ESCAPE:
-                    pygame.display.quit()
-                    sys.exit(0)
-                if event.key == pygame.K_r:
-                    lander.fuel += 10
-                if event.key == pygame.K_l:
-                    lander.degree = 0
-                if event.key == pygame.K_p:
-                    if lander.pause is True:
-                        lander.pause = False
-                    else:
-                        lander.pause = True
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_LEFT:
-                    lander.spin_stop()
-                if event.key == pygame.K_RIGHT:
-                    lander.spin_stop()
-            if event.type == pygame.QUIT:
-                pygame.display.quit()
-
-        lander.update_telemetry()
-        screen.blit(lander.current_surface, lander.get_position())
+                action = KEYDOWN_ACTIONS.get(event.key)
+            elif event.type == pygame.KEYUP:
+                action = KEYUP_ACTIONS.get(event.key)
+            else:
+                action = quit_game
+            if action is not None:
+                action(lander)
+
+        now = pygame.time.get_ticks()
+        # drop time beyond a few ticks after a stall (window drag, mode
+        # switch) rather than replaying it all at once
+        acc = min(acc + now - prev, 5 * PHYS_DT_MS)
+        prev = now
+        while acc >= PHYS_DT_MS:
+            lander.update_telemetry()
+            acc -= PHYS_DT_MS
 
         msg = 'Fuel: {:.1f}%  Speed: {:.1f} m/s'.format(lander.fuel, lander.speed)
-        text = font.render(msg, True, WHITE)
-        textpos = text.get_rect()
-        textpos.centerx = screen.get_rect().centerx
-        screen.blit(text, textpos)
-
-        clock.tick(30)  # Max fps
-        pygame.display.flip()
+        ship_pos = lander.get_position()
+        ship_rect = ship_pos.clip(screen_rect)
+
+        # the antialiased readout blends onto whatever is under it, so it is
+        # only redrawn over freshly restored background: when its text
+        # changes, or when the ship covers or just left part of it
+        redraw_text = (full_update or msg != last_msg or
+                       ship_rect.colliderect(last_textpos) or
+                       (prev_ship_rect is not None and
+                        prev_ship_rect.colliderect(last_textpos)))
+
+        # restore background under last frame's ship, and readout if it's
+        # about to be redrawn
+        dirty = []
+        if full_update:
+            screen.blit(bg, (0,0))
+        elif prev_ship_rect is not None:
+            screen.blit(bg, prev_ship_rect, prev_ship_rect)
+            dirty.append(prev_ship_rect)
+        if redraw_text and last_textpos is not None:
+            screen.blit(bg, last_textpos, last_textpos)
+            dirty.append(last_textpos)
+
+        screen.blit(lander.current_surface, ship_pos)
+        prev_ship_rect = ship_rect
+        dirty.append(ship_rect)
+
+        # only re-render the readout when its displayed value changes
+        if msg != last_msg:
+            last_msg = msg
+            last_text = font.render(msg, True, WHITE)
+            last_textpos = last_text.get_rect()
+            last_textpos.centerx = screen_rect.centerx
+            dirty.append(last_textpos)
+        if redraw_text:
+            screen.blit(last_text, last_textpos)
+
+        clock.tick(FPS)  # Max fps
+        if full_update:
+            pygame.display.flip()
+            full_update = False
+        else:
+            pygame.display.update(dirty)
 
 
 if __name__ == '__main__':